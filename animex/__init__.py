@@ -0,0 +1,10 @@
+"""
+animex content tools.
+
+Manages content.json (spotlight and horizontal sections) using pluggable
+backends for anime metadata, AI suggestions and episode downloads. Importing
+this package has no side effects and does not load any backend; each backend
+is imported the first time it is used (see animex.backends).
+"""
+
+__version__ = "0.1.0"
@@ -0,0 +1,99 @@
+"""
+Registry of pluggable backends.
+
+Backends are referenced by a "module:attribute" spec and only imported the
+first time they are requested, so heavy SDKs (google-generativeai, requests,
+BeautifulSoup, pyautogui) never load unless the feature that needs them is
+used. A backend is chosen, in order, by an explicit name, a name picked
+with select() (e.g. from CLI flags), the ANIMEX_<KIND>_BACKEND environment
+variable, or the registry default. Any "module:attribute" spec may be passed
+instead of a registered name.
+"""
+import importlib
+import importlib.util
+import os
+
+BACKENDS = {
+    "ai": {
+        "gemini": "animex.providers.gemini:GeminiProvider",
+    },
+    "metadata": {
+        "jikan": "animex.providers.jikan:JikanProvider",
+    },
+    "downloader": {
+        "gogo": "animex.providers.gogo:GogoDownloader",
+    },
+}
+
+DEFAULTS = {
+    "ai": "gemini",
+    "metadata": "jikan",
+    "downloader": "gogo",
+}
+
+_selected = {}
+_loaded = {}
+_instances = {}
+
+
+def resolve(kind, name=None):
+    """Returns the "module:attribute" spec for a backend kind and optional name."""
+    if kind not in BACKENDS:
+        raise ValueError(f"Unknown backend kind '{kind}'. Expected one of: {', '.join(BACKENDS)}")
+    name = name or _selected.get(kind) or os.getenv(f"ANIMEX_{kind.upper()}_BACKEND") or DEFAULTS[kind]
+    if ":" in name:
+        return name
+    if name not in BACKENDS[kind]:
+        raise ValueError(f"Unknown {kind} backend '{name}'. Available: {', '.join(BACKENDS[kind])}")
+    return BACKENDS[kind][name]
+
+
+def validate(kind, name=None):
+    """
+    Resolves a backend and checks that its module can be found, without
+    importing it. Raises ValueError for unknown names and ImportError for
+    specs whose module does not exist.
+    """
+    spec = resolve(kind, name)
+    module_name, _, attr = spec.partition(":")
+    try:
+        found = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        found = None
+    if found is None or not attr:
+        raise ImportError(f"Cannot find {kind} backend '{spec}'.")
+    return spec
+
+
+def select(kind, name):
+    """Validates `name` and makes it the backend used for `kind` when no name is given."""
+    validate(kind, name)
+    _selected[kind] = name
+
+
+def load_backend(kind, name=None):
+    """Imports (once) and returns the backend class for `kind`."""
+    spec = resolve(kind, name)
+    if spec not in _loaded:
+        module_name, _, attr = spec.partition(":")
+        module = importlib.import_module(module_name)
+        try:
+            _loaded[spec] = getattr(module, attr)
+        except AttributeError:
+            raise ImportError(f"Module '{module_name}' has no {kind} backend '{attr}'.") from None
+    return _loaded[spec]
+
+
+def get_backend(kind, name=None):
+    """Returns a shared instance of the backend for `kind`, creating it on first use."""
+    spec = resolve(kind, name)
+    if spec not in _instances:
+        _instances[spec] = load_backend(kind, name)()
+    return _instances[spec]
+
+
+def register(kind, name, spec):
+    """Registers an additional backend, e.g. from a third-party tool."""
+    if kind not in BACKENDS:
+        raise ValueError(f"Unknown backend kind '{kind}'. Expected one of: {', '.join(BACKENDS)}")
+    BACKENDS[kind][name] = spec
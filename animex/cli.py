@@ -0,0 +1,581 @@
+"""
+Command-line entry point for the animex content tools.
+
+Only the standard library is imported here; backends and subcommand modules
+are loaded when a command first needs them, so `animex --help` and the
+interactive menu open without paying for requests or any AI SDK.
+"""
+import argparse
+import json
+import os
+
+from animex import backends, config
+from animex.backends import get_backend, load_backend
+
+# --- Helper Functions ---
+def clear_screen():
+    """Clears the console screen."""
+    os.system('cls' if os.name == 'nt' else 'clear')
+
+def get_choice(max_choice, allow_back=True):
+    """Gets and validates a user's integer choice."""
+    while True:
+        try:
+            prompt = "> "
+            choice = input(prompt)
+            if allow_back and choice.lower() == 'b':
+                return 'b'
+            choice = int(choice)
+            if 1 <= choice <= max_choice:
+                return choice
+            else:
+                print(f"Invalid choice. Please enter a number between 1 and {max_choice}.")
+        except ValueError:
+            print("Invalid input. Please enter a number.")
+
+def get_metadata_backend():
+    """Returns the metadata backend, or None after telling the user why it could not be loaded."""
+    try:
+        return get_backend("metadata")
+    except (ImportError, ValueError) as e:
+        print(f"An error occurred while loading the metadata backend: {e}")
+        input("Press Enter to return.")
+        return None
+
+def search_and_select_anime():
+    """Prompts user to search for an anime, displays results, and returns the selected one."""
+    query = input("Enter search term (or 'b' to go back): ")
+    if query.lower() == 'b':
+        return None
+        
+    provider = get_metadata_backend()
+    if provider is None:
+        return None
+
+    results = provider.search(query, limit=10)
+    if not results:
+        print("No results found.")
+        input("Press Enter to continue...")
+        return None
+
+    clear_screen()
+    print(f"--- Search Results for '{query}' ---")
+    for i, anime in enumerate(results, 1):
+        print(f"[{i}] {anime.get('title_english') or anime.get('title')} ({anime.get('type', 'N/A')}, {anime.get('year', 'N/A')})")
+    
+    print("\n[b] Back to previous menu")
+    
+    print("\nSelect an anime to add:")
+    choice = get_choice(len(results))
+    if choice == 'b':
+        return None
+        
+    return results[choice - 1]
+
+# --- Management Logic ---
+def manage_spotlight(data):
+    """Handles logic for managing the spotlight section."""
+    while True:
+        clear_screen()
+        print("--- Manage Spotlight Section ---")
+        if not data['spotlight']:
+            print("Spotlight is currently empty.")
+        else:
+            for i, item in enumerate(data['spotlight'], 1):
+                print(f"[{i}] {item['name']} (ID: {item['id']})")
+        
+        print("\nOptions:")
+        print("[1] Add an anime to Spotlight")
+        print("[2] Remove an anime from Spotlight")
+        print("[b] Back to Main Menu")
+        
+        choice = input("> ").lower()
+        
+        if choice == '1':
+            anime_obj = search_and_select_anime()
+            if anime_obj:
+                if any(item['id'] == anime_obj['mal_id'] for item in data['spotlight']):
+                    print(f"'{anime_obj['title']}' is already in the spotlight.")
+                else:
+                    formatted = get_backend("metadata").format(anime_obj)
+                    data['spotlight'].append(formatted)
+                    print(f"Added '{formatted['name']}' to spotlight.")
+                input("Press Enter to continue...")
+        
+        elif choice == '2':
+            if not data['spotlight']:
+                print("Nothing to remove.")
+                input("Press Enter to continue...")
+                continue
+            print("Enter the number of the anime to remove (or 'b' to cancel):")
+            remove_choice = get_choice(len(data['spotlight']))
+            if remove_choice != 'b':
+                removed = data['spotlight'].pop(remove_choice - 1)
+                print(f"Removed '{removed['name']}' from spotlight.")
+                input("Press Enter to continue...")
+
+        elif choice == 'b':
+            return
+
+def manage_sections(data):
+    """Handles logic for managing horizontal sections."""
+    while True:
+        clear_screen()
+        print("--- Manage Horizontal Sections ---")
+        if not data['sections']:
+            print("No sections created yet.")
+        else:
+            for i, section in enumerate(data['sections'], 1):
+                print(f"[{i}] {section['title']} ({len(section['items'])} items)")
+        
+        print("\nOptions:")
+        print("[1] Create a new section")
+        print("[2] Edit an existing section")
+        print("[3] Delete a section")
+        print("[b] Back to Main Menu")
+        
+        choice = input("> ").lower()
+
+        if choice == '1':
+            title = input("Enter title for new section: ")
+            data['sections'].append({"title": title, "items": []})
+            print(f"Section '{title}' created.")
+            input("Press Enter...")
+        
+        elif choice == '2':
+            if not data['sections']:
+                print("No sections to edit.")
+                input("Press Enter...")
+                continue
+            for i, section in enumerate(data['sections'], 1):
+                print(f"[{i}] {section['title']} ({len(section['items'])} items)")
+            print("Select a section to edit:")
+            edit_choice = get_choice(len(data['sections']))
+            if edit_choice != 'b':
+                edit_section_menu(data['sections'][edit_choice - 1])
+
+        elif choice == '3':
+            if not data['sections']:
+                print("No sections to delete.")
+                input("Press Enter...")
+                continue
+            print("Select a section to delete:")
+            delete_choice = get_choice(len(data['sections']))
+            if delete_choice != 'b':
+                removed = data['sections'].pop(delete_choice - 1)
+                print(f"Deleted section '{removed['title']}'.")
+                input("Press Enter...")
+
+        elif choice == 'b':
+            return
+
+def edit_section_menu(section):
+    """Menu for editing a specific section."""
+    while True:
+        clear_screen()
+        print(f"--- Editing Section: {section['title']} ---")
+        if not section['items']:
+            print("This section is empty.")
+        else:
+            for i, item in enumerate(section['items'], 1):
+                print(f"  [{i}] {item['name']} (ID: {item['id']})")
+        
+        print("\nOptions:")
+        print("[1] Add an anime to this section (Manual Search)")
+        print("[2] Remove an anime from this section")
+        print("[3] Auto-populate this section (from Jikan)")
+        print("[4] Generate content with AI")
+        print("[5] Rename this section")
+        print("[b] Back to Sections Menu")
+        
+        choice = input("> ").lower()
+
+        if choice == '1':
+            anime_obj = search_and_select_anime()
+            if anime_obj:
+                if any(item['id'] == anime_obj['mal_id'] for item in section['items']):
+                    print(f"'{anime_obj['title']}' is already in this section.")
+                else:
+                    formatted = get_backend("metadata").format(anime_obj)
+                    section['items'].append(formatted)
+                    print(f"Added '{formatted['name']}' to '{section['title']}'.")
+                input("Press Enter...")
+
+        elif choice == '2':
+            if not section['items']:
+                print("Nothing to remove.")
+                input("Press Enter...")
+                continue
+            print("Enter the number of the anime to remove:")
+            remove_choice = get_choice(len(section['items']))
+            if remove_choice != 'b':
+                removed = section['items'].pop(remove_choice - 1)
+                print(f"Removed '{removed['name']}' from '{section['title']}'.")
+                input("Press Enter...")
+        
+        elif choice == '3':
+            auto_populate_section(section)
+        
+        elif choice == '4':
+            generate_with_ai(section)
+
+        elif choice == '5':
+            new_title = input(f"Enter new title for '{section['title']}': ")
+            section['title'] = new_title
+            print("Section renamed.")
+            input("Press Enter...")
+
+        elif choice == 'b':
+            return
+
+def auto_populate_section(section):
+    """Automatically populates a section from one of the metadata backend's categories."""
+    provider = get_metadata_backend()
+    if provider is None:
+        return
+    categories = list(provider.CATEGORIES)
+
+    clear_screen()
+    print(f"--- Auto-Populate Section: {section['title']} ---")
+    print("Select a category to populate from:")
+    for i, label in enumerate(categories, 1):
+        print(f"[{i}] {label}")
+    print("[b] Cancel")
+
+    choice = get_choice(len(categories))
+    if choice == 'b':
+        return
+
+    count = input("How many new anime should be added? [15]: ").strip()
+    try:
+        count = int(count) if count else 15
+    except ValueError:
+        print("Invalid number. Using the default of 15.")
+        count = 15
+    if count < 1:
+        return
+
+    existing_ids = [item['id'] for item in section['items']]
+    new_items, skipped_count, fetch_failed = provider.collect_new(categories[choice - 1], existing_ids, count)
+    if fetch_failed and not new_items:
+        print("Could not fetch data for this category. The API may be rate limiting; try again shortly.")
+        input("Press Enter...")
+        return
+
+    section['items'].extend(new_items)
+    print(f"Added {len(new_items)} new items and skipped {skipped_count} duplicates in '{section['title']}'.")
+    if fetch_failed:
+        print(f"Stopped after {len(new_items)} of the {count} requested because a page could not be fetched. "
+              "Run auto-populate again to continue.")
+    elif len(new_items) < count:
+        print(f"The category ran out of new anime after {len(new_items)} of the {count} requested.")
+    input("Press Enter...")
+
+def generate_with_ai(section):
+    """Generates content for a section using the configured AI backend."""
+    clear_screen()
+    print(f"--- AI Content Generation for: {section['title']} ---")
+    
+    # 1. Load the AI provider (imports its SDK on first use)
+    try:
+        provider = get_backend("ai")
+    except Exception as e:
+        print(f"An error occurred while configuring the AI model: {e}")
+        input("Press Enter to return.")
+        return
+
+    metadata = get_metadata_backend()
+    if metadata is None:
+        return
+
+    # 2. Get user prompt
+    print("Describe the kind of anime you want to find.")
+    print("Examples: 'top 10 classic sci-fi anime', 'underrated shows with great world-building', 'anime for beginners'")
+    user_prompt = input("\nEnter your prompt: ")
+    if not user_prompt:
+        return
+
+    # 3. Query the AI model
+    print("\nAsking the AI for suggestions... this may take a moment.")
+    try:
+        ai_suggestions = provider.suggest_titles(user_prompt, count=10)
+    except Exception as e:
+        print(f"An error occurred while communicating with the AI: {e}")
+        input("Press Enter to return.")
+        return
+
+    if not ai_suggestions:
+        print("The AI didn't return any valid suggestions. Try a different prompt.")
+        input("Press Enter to return.")
+        return
+
+    print(f"\nAI suggested {len(ai_suggestions)} anime titles.")
+    
+    # 4. Process suggestions: Search Jikan and get user confirmation
+    print("\n--- Confirm AI Suggestions ---")
+    print("For each suggestion, I will find the closest match on MyAnimeList.")
+    print("Please confirm if the match is correct.")
+    
+    confirmed_anime = []
+    for i, suggestion in enumerate(ai_suggestions, 1):
+        print(f"\n[{i}/{len(ai_suggestions)}] Searching for: '{suggestion}'...")
+        results = metadata.search(suggestion, limit=3)
+        
+        if not results:
+            print(f"--> Could not find any match for '{suggestion}'.")
+            continue
+        
+        # Show top match but also alternatives if the first doesn't seem right
+        match = results[0]
+        title = match.get('title_english') or match.get('title')
+        
+        print(f"--> Best match: '{title}' ({match.get('type', 'N/A')}, {match.get('year', 'N/A')})")
+        
+        # Show alternatives if available
+        if len(results) > 1:
+            print("    Alternatives:")
+            for j, alt in enumerate(results[1:3], 2):
+                alt_title = alt.get('title_english') or alt.get('title')
+                print(f"    [{j}] {alt_title} ({alt.get('type', 'N/A')}, {alt.get('year', 'N/A')})")
+        
+        while True:
+            if len(results) > 1:
+                choice = input("    Choose: [1] Use best match, [2-3] Use alternative, [s] Skip, [Enter] Use best match: ").strip().lower()
+            else:
+                choice = input("    [Enter] Add this anime, [s] Skip: ").strip().lower()
+            
+            if choice == '' or choice == '1':
+                selected_match = results[0]
+                break
+            elif choice == 's':
+                selected_match = None
+                break
+            elif choice in ['2', '3'] and len(results) > int(choice) - 1:
+                selected_match = results[int(choice) - 1]
+                break
+            else:
+                print("    Invalid choice. Please try again.")
+        
+        if selected_match:
+            formatted = metadata.format(selected_match)
+            # Avoid adding duplicates
+            if any(a['id'] == formatted['id'] for a in confirmed_anime):
+                print(f"--> Already added '{formatted['name']}'. Skipping.")
+            else:
+                confirmed_anime.append(formatted)
+                print(f"--> Added '{formatted['name']}' to the list.")
+        else:
+            print(f"--> Skipped '{suggestion}'.")
+
+    # 5. Final review and add to section
+    if not confirmed_anime:
+        print("\nNo new anime were confirmed. Returning to menu.")
+        input("Press Enter...")
+        return
+
+    clear_screen()
+    print("--- Final Review ---")
+    print("The following new anime will be added to the section:")
+    for item in confirmed_anime:
+        print(f"- {item['name']}")
+
+    final_confirm = input("\nAdd these items to the section? [Y/n]: ").lower()
+    if final_confirm == '' or final_confirm == 'y':
+        added_count = 0
+        skipped_count = 0
+        for anime in confirmed_anime:
+            if not any(item['id'] == anime['id'] for item in section['items']):
+                section['items'].append(anime)
+                added_count += 1
+            else:
+                skipped_count += 1
+        print(f"\nSuccessfully added {added_count} new anime.")
+        if skipped_count > 0:
+            print(f"Skipped {skipped_count} anime that were already in the section.")
+    else:
+        print("Operation cancelled. No changes were made.")
+    
+    input("Press Enter to continue...")
+
+
+
+# --- Main Application ---
+def manage():
+    """Runs the interactive content manager."""
+    data = None
+    
+    # Check if a content file exists and prompt the user.
+    if os.path.exists(config.CONTENT_FILE):
+        clear_screen()
+        print("--- Welcome Back ---")
+        print(f"Found existing content file: '{config.CONTENT_FILE}'")
+        print("\nWhat would you like to do?")
+        print("[1] Load the existing content")
+        print("[2] Start from scratch (Warning: saving will overwrite the old file)")
+
+        while data is None:
+            choice = input("> ")
+            if choice == '1':
+                try:
+                    data = config.load_content()
+                    print("Content loaded successfully.")
+                except (json.JSONDecodeError, FileNotFoundError):
+                    print(f"Error: Could not read or parse '{config.CONTENT_FILE}'. Starting from scratch.")
+                    data = {"spotlight": [], "sections": []}
+            elif choice == '2':
+                print("Starting with a blank slate.")
+                data = {"spotlight": [], "sections": []}
+            else:
+                print("Invalid choice. Please enter 1 or 2.")
+        input("Press Enter to continue...")
+    else:
+        # If no content file exists, start from scratch automatically.
+        print(f"No '{config.CONTENT_FILE}' found. Starting with a blank slate.")
+        data = {"spotlight": [], "sections": []}
+        input("Press Enter to continue...")
+
+
+    while True:
+        clear_screen()
+        print("--- Anime Content Manager ---")
+        print(" (with AI-Powered Suggestions)")
+        print("\nSelect an option:")
+        print("[1] Manage Spotlight Section")
+        print("[2] Manage Horizontal Sections")
+        print("[3] Save and Exit")
+        print("[4] Exit Without Saving")
+        
+        choice = input("> ")
+
+        if choice == '1':
+            manage_spotlight(data)
+        elif choice == '2':
+            manage_sections(data)
+        elif choice == '3':
+            config.save_content(data)
+            print(f"Content saved to {config.CONTENT_FILE}.")
+            break
+        elif choice == '4':
+            print("Exiting without saving changes.")
+            break
+        else:
+            print("Invalid option. Please try again.")
+            input("Press Enter to continue...")
+
+
+def check_links(args):
+    from animex import links
+
+    options = {"refresh": args.refresh, "repair": not args.no_repair}
+    # Leave unset limits to the defaults in animex.links
+    if args.workers is not None:
+        options["workers"] = args.workers
+    if args.max_size is not None:
+        options["max_size"] = args.max_size
+    links.run(**options)
+
+
+def download(args):
+    """Runs the downloader backend. Returns a non-zero exit status if it could not be loaded."""
+    try:
+        downloader_class = load_backend("downloader")
+        if args.base_url:
+            downloader = downloader_class(args.anime, base_url=args.base_url)
+        else:
+            downloader = downloader_class(args.anime)
+    except ImportError as e:
+        print(f"An error occurred while loading the downloader: {e}")
+        return 1
+
+    if args.episode is not None:
+        downloader.caller(typ="single", eps_number=args.episode)
+    elif args.start is not None:  # main() ensures --end is given with --start
+        downloader.caller(typ="range", start=args.start, end=args.end)
+    else:
+        downloader.caller(typ="all")
+    return 0
+
+
+def import_report(args):
+    from animex import importtime
+
+    return importtime.report(module=args.module, runs=args.runs, target_ms=args.target_ms, top=args.top)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="animex", description="Manage animex content.json and media.")
+    parser.add_argument("--ai", help="AI backend name or module:Class spec (default: gemini)")
+    parser.add_argument("--metadata", help="metadata backend name or module:Class spec (default: jikan)")
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("manage", help="interactive content manager (default)")
+
+    check = subparsers.add_parser("check", help="check the health of media URLs in content.json")
+    check.add_argument("--workers", type=int, help="number of concurrent probes (default: 16)")
+    check.add_argument("--max-size", type=int, help="flag assets larger than this many bytes (default: 2 MiB)")
+    check.add_argument("--refresh", action="store_true", help="ignore cached results and re-probe every URL")
+    check.add_argument("--no-repair", action="store_true", help="only report, don't replace dead images")
+
+    dl = subparsers.add_parser("download", help="download episodes of an anime")
+    dl.add_argument("anime", help="anime slug on the download site, e.g. one-piece-dub")
+    dl.add_argument("--backend", help="downloader backend name or module:Class spec (default: gogo)")
+    dl.add_argument("--base-url", help="override the download site's base URL")
+    episodes = dl.add_mutually_exclusive_group()
+    episodes.add_argument("--start", type=int, help="first episode of a range (requires --end)")
+    episodes.add_argument("--episode", type=int, help="download a single episode")
+    dl.add_argument("--end", type=int, help="last episode of a range (requires --start)")
+
+    report = subparsers.add_parser("import-report", help="measure cold-start import time")
+    report.add_argument("--module", default="animex.cli", help="module to import (default: animex.cli)")
+    report.add_argument("--runs", type=int, default=5, help="number of fresh interpreters to time")
+    report.add_argument("--target-ms", type=float, default=None, help="cold-start budget in milliseconds")
+    report.add_argument("--top", type=int, default=15, help="number of slowest modules to list")
+
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "download" and (args.start is None) != (args.end is None):
+        parser.error("download: --start and --end must be given together")
+    if args.command == "download" and args.start is not None and args.start > args.end:
+        parser.error("download: --start must not be greater than --end")
+    if args.command == "import-report" and args.runs < 1:
+        parser.error("import-report: --runs must be at least 1")
+    if args.command == "check":
+        if args.workers is not None and args.workers < 1:
+            parser.error("check: --workers must be at least 1")
+        if args.max_size is not None and args.max_size < 1:
+            parser.error("check: --max-size must be at least 1")
+
+    # Check every backend this command may use before any menu opens
+    chosen = {"ai": args.ai, "metadata": args.metadata,
+              "downloader": getattr(args, "backend", None)}
+    used = {
+        "check": ("metadata",),
+        "download": ("downloader",),
+        "import-report": (),
+    }.get(args.command, ("ai", "metadata"))
+    for kind, name in chosen.items():
+        try:
+            if name:
+                backends.select(kind, name)
+            elif kind in used:
+                backends.validate(kind)
+        except (ImportError, ValueError) as e:
+            parser.error(str(e))
+
+    if args.command == "check":
+        check_links(args)
+    elif args.command == "download":
+        raise SystemExit(download(args))
+    elif args.command == "import-report":
+        raise SystemExit(import_report(args))
+    else:
+        manage()
+
+
+if __name__ == "__main__":
+    main()
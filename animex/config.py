@@ -0,0 +1,58 @@
+import getpass
+import json
+import os
+
+# --- Configuration ---
+CONTENT_FILE = "content.json"
+CONFIG_FILE = "config.ini"
+
+
+# --- API Key and Configuration Management ---
+def get_api_key():
+    """Gets the Google AI API key, prompting the user if not found."""
+    # Check environment variable first
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if api_key:
+        print("Loaded Google API Key from environment variable.")
+        input("Press Enter to continue...")
+        return api_key
+
+    # Check config file next
+    if os.path.exists(CONFIG_FILE):
+        with open(CONFIG_FILE, 'r') as f:
+            config = json.load(f)
+            api_key = config.get("GOOGLE_API_KEY")
+            if api_key:
+                print("Loaded Google API Key from config.ini.")
+                input("Press Enter to continue...")
+                return api_key
+
+    # If not found, prompt the user
+    print("\n--- Google AI API Key Required ---")
+    print("To use the AI generation feature, you need a Google AI API Key.")
+    print("You can get a free key from Google AI Studio.")
+    print("The key will be stored locally in 'config.ini' so you don't have to enter it again.")
+
+    api_key = getpass.getpass("Please enter your Google AI API Key: ")
+
+    # Save the key to config.ini for future use
+    with open(CONFIG_FILE, 'w') as f:
+        json.dump({"GOOGLE_API_KEY": api_key}, f)
+
+    print("API Key saved to config.ini.")
+    return api_key
+
+
+def load_content():
+    """Reads content.json, making sure the spotlight and sections lists exist."""
+    with open(CONTENT_FILE, 'r') as f:
+        data = json.load(f)
+    # Ensure the basic structure exists, in case the file is malformed
+    if 'spotlight' not in data: data['spotlight'] = []
+    if 'sections' not in data: data['sections'] = []
+    return data
+
+
+def save_content(data):
+    with open(CONTENT_FILE, 'w') as f:
+        json.dump(data, f, indent=4)
@@ -0,0 +1,96 @@
+"""
+Cold-start measurement for the animex CLI.
+
+Each run imports the target module in a fresh interpreter, so nothing is
+shared between runs and the numbers reflect what a user pays on launch.
+The report shows the median import time against COLD_START_TARGET_MS, the
+slowest modules from `python -X importtime`, and any heavy backend
+dependency that was imported eagerly.
+"""
+import statistics
+import subprocess
+import sys
+
+# Budget for `import animex.cli` in a fresh interpreter, excluding interpreter startup
+COLD_START_TARGET_MS = 50.0
+
+# Modules that must only be imported by the backends that need them
+HEAVY_MODULES = ("requests", "google.generativeai", "bs4", "pyautogui")
+
+_TIMER = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = (time.perf_counter() - start) * 1000\n"
+    "heavy = [m for m in {heavy!r} if m in sys.modules]\n"
+    "print(elapsed, ','.join(heavy))\n"
+)
+
+
+def time_import(module):
+    """Imports `module` in a fresh interpreter. Returns (milliseconds, eagerly imported heavy modules)."""
+    code = _TIMER.format(module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    elapsed, _, heavy = output.strip().partition(" ")
+    return float(elapsed), [m for m in heavy.split(",") if m]
+
+
+def _importtime_entries(code):
+    """Runs `code` under `python -X importtime`. Returns {name: (cumulative_us, self_us)}."""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            capture_output=True, text=True, check=True).stderr
+    entries = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        entries[name] = (int(cumulative_us), int(self_us))
+    return entries
+
+
+def slowest_imports(module, top=15):
+    """
+    Runs `python -X importtime` on `module` and returns the `top` entries as
+    (cumulative_us, self_us, name), slowest cumulative first. Modules that a
+    bare interpreter (`-c pass`) already loads are left out, so only what
+    `import module` itself pulls in is listed.
+    """
+    startup = _importtime_entries("pass")
+    entries = [(cumulative_us, self_us, name)
+               for name, (cumulative_us, self_us) in _importtime_entries(f"import {module}").items()
+               if name not in startup]
+    entries.sort(reverse=True)
+    return entries[:top]
+
+
+def report(module="animex.cli", runs=5, target_ms=None, top=15):
+    """Prints the import-time report. Returns 0 if the target is met, 1 otherwise."""
+    target_ms = COLD_START_TARGET_MS if target_ms is None else target_ms
+    timings = []
+    heavy = set()
+    try:
+        for _ in range(runs):
+            elapsed, eager = time_import(module)
+            timings.append(elapsed)
+            heavy.update(eager)
+        slowest = slowest_imports(module, top)
+    except subprocess.CalledProcessError as e:
+        error = e.stderr.strip().splitlines()[-1] if e.stderr.strip() else f"exit status {e.returncode}"
+        print(f"Error: could not import {module}: {error}")
+        return 1
+    median = statistics.median(timings)
+
+    print(f"--- Import-Time Report: {module} ---")
+    print(f"Cold start over {runs} runs: median {median:.1f} ms (min {min(timings):.1f}, max {max(timings):.1f})")
+    print(f"Target: {target_ms:.0f} ms -> {'OK' if median <= target_ms else 'OVER BUDGET'}")
+
+    print("\nSlowest imports (cumulative / self, ms):")
+    for cumulative_us, self_us, name in slowest:
+        print(f"  {cumulative_us / 1000:8.1f} {self_us / 1000:8.1f}  {name}")
+
+    if heavy:
+        print(f"\nHeavy modules imported eagerly: {', '.join(sorted(heavy))}")
+    else:
+        print("\nNo heavy backend dependencies were imported.")
+
+    return 0 if median <= target_ms and not heavy else 1
@@ -0,0 +1,234 @@
+"""Link-health checker for the media URLs in content.json."""
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from animex.backends import get_backend
+from animex.config import CONTENT_FILE, save_content
+
+# --- Configuration ---
+CACHE_FILE = ".linkcheck.json"
+CACHE_TTL = 24 * 60 * 60      # Re-probe URLs whose cached result is older than a day
+ERROR_CACHE_TTL = 15 * 60     # Broken results are re-probed sooner, so a recovered host isn't reported for a day
+DEFAULT_WORKERS = 16
+REQUEST_TIMEOUT = 10          # seconds
+SLOW_THRESHOLD = 2.0          # seconds
+OVERSIZED_THRESHOLD = 2 * 1024 * 1024  # bytes
+DEAD_STATUSES = {404, 410}    # Statuses treated as a permanently missing asset
+DEAD_AFTER_FAILURES = 3       # Network errors and 5xx only count as dead once they repeat across this many runs
+MEDIA_FIELDS = ("image", "logo")
+USER_AGENT = "animex-linkcheck/1.0"
+
+
+# --- content.json Traversal ---
+def iter_media_entries(data):
+    """
+    Yields (item, field, url) for every media URL in content.json,
+    covering both the spotlight and every horizontal section.
+    """
+    items = list(data.get('spotlight', []))
+    for section in data.get('sections', []):
+        items.extend(section.get('items', []))
+
+    for item in items:
+        for field in MEDIA_FIELDS:
+            url = item.get(field)
+            if url:
+                yield item, field, url
+
+
+# --- Probing ---
+def make_session(workers):
+    """Creates a session whose connection pool is large enough for every worker."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    return session
+
+def parse_size(headers):
+    """Reads the full asset size from Content-Range (ranged GET) or Content-Length."""
+    content_range = headers.get("Content-Range", "")
+    if "/" in content_range:
+        total = content_range.rsplit("/", 1)[1]
+        if total.isdigit():
+            return int(total)
+    length = headers.get("Content-Length")
+    return int(length) if length and length.isdigit() else None
+
+def probe_url(session, url, previous=None):
+    """
+    Probes a single URL with a HEAD request, falling back to a one-byte ranged
+    GET when the host rejects HEAD or omits the size.
+    Returns a result dict with status, latency, size and content type.
+
+    `dead` is decided here: 404/410 mark the asset as gone immediately, while
+    network errors and 5xx responses are counted in `failures`, carried over
+    from the `previous` result, and only mark it dead once they have repeated
+    DEAD_AFTER_FAILURES times in a row.
+    """
+    result = {"status": None, "latency": None, "size": None, "content_type": None,
+              "error": None, "failures": 0, "dead": False, "checked_at": time.time()}
+    start = time.perf_counter()
+    try:
+        response = session.head(url, allow_redirects=True, timeout=REQUEST_TIMEOUT)
+        if response.status_code >= 400 or parse_size(response.headers) is None:
+            response = session.get(url, headers={"Range": "bytes=0-0"}, stream=True,
+                                   allow_redirects=True, timeout=REQUEST_TIMEOUT)
+            response.close()
+        result["status"] = response.status_code
+        result["size"] = parse_size(response.headers)
+        result["content_type"] = response.headers.get("Content-Type")
+    except requests.exceptions.RequestException as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["latency"] = round(time.perf_counter() - start, 3)
+
+    if result["error"] is not None or result["status"] >= 500:
+        result["failures"] = (previous or {}).get("failures", 0) + 1
+    result["dead"] = result["status"] in DEAD_STATUSES or result["failures"] >= DEAD_AFTER_FAILURES
+    return result
+
+def is_dead(result):
+    """Whether the probe marked the URL as permanently gone, so its image may be replaced."""
+    return result.get("dead", False)
+
+def is_broken(result):
+    return result["error"] is not None or result["status"] >= 400
+
+def is_fresh(result, now):
+    """Whether a cached result is recent enough to reuse; broken results expire after ERROR_CACHE_TTL."""
+    ttl = ERROR_CACHE_TTL if is_broken(result) else CACHE_TTL
+    return now - result["checked_at"] <= ttl
+
+
+# --- Result Cache ---
+def load_cache():
+    if not os.path.exists(CACHE_FILE):
+        return {}
+    try:
+        with open(CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+def save_cache(cache):
+    with open(CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=4)
+
+def check_urls(urls, workers, refresh=False):
+    """
+    Probes every URL concurrently over a pooled session, reusing cached results
+    that are still fresh (see is_fresh) unless `refresh` is set.
+    Returns {url: result}. Cached results for URLs that are no longer in
+    `urls` (e.g. images that were repaired) are dropped.
+    """
+    cache = load_cache()
+    now = time.time()
+    current = set(urls)
+    stale = [url for url in cache if url not in current]
+    for url in stale:
+        del cache[url]
+    to_probe = [url for url in urls
+                if refresh or url not in cache or not is_fresh(cache[url], now)]
+    print(f"Checking {len(urls)} unique URLs ({len(urls) - len(to_probe)} cached, {len(to_probe)} to probe)...")
+
+    if to_probe:
+        with make_session(workers) as session, ThreadPoolExecutor(max_workers=workers) as executor:
+            for url, result in zip(to_probe, executor.map(lambda u: probe_url(session, u, cache.get(u)), to_probe)):
+                cache[url] = result
+    if to_probe or stale:
+        save_cache(cache)
+
+    return {url: cache[url] for url in urls}
+
+
+# --- Repair ---
+def fetch_replacement_image(anime_id):
+    """Looks up a fresh cover image for an anime from the metadata backend (Jikan by default)."""
+    anime_obj = get_backend("metadata").get_anime(anime_id)
+    if not anime_obj:
+        return None
+    return anime_obj.get('images', {}).get('jpg', {}).get('large_image_url')
+
+def repair_dead_images(entries, results):
+    """
+    Replaces dead `image` URLs with the Jikan cover for the same `id`.
+    Logos have no Jikan equivalent and are only reported.
+    Returns the number of fields that were changed.
+    """
+    repaired = 0
+    replacements = {}
+    for item, field, url in entries:
+        if field != "image" or not is_dead(results[url]) or "id" not in item:
+            continue
+        if item["id"] not in replacements:
+            replacements[item["id"]] = fetch_replacement_image(item["id"])
+        new_url = replacements[item["id"]]
+        if new_url and new_url != url:
+            print(f"Repaired image for '{item.get('name', item['id'])}': {new_url}")
+            item[field] = new_url
+            repaired += 1
+        else:
+            print(f"No replacement found for '{item.get('name', item['id'])}'.")
+    return repaired
+
+
+# --- Reporting ---
+def print_report(entries, results, max_size):
+    names = {}
+    for item, field, url in entries:
+        names.setdefault(url, []).append(f"{item.get('name', item.get('id'))} [{field}]")
+
+    broken, slow, oversized = [], [], []
+    for url, result in results.items():
+        if is_broken(result):
+            broken.append(url)
+            continue
+        if result["latency"] > SLOW_THRESHOLD:
+            slow.append(url)
+        if result["size"] and result["size"] > max_size:
+            oversized.append(url)
+
+    print("\n--- Link Health Report ---")
+    print(f"OK: {len(results) - len(broken)}  Broken: {len(broken)}  Slow: {len(slow)}  Oversized: {len(oversized)}")
+
+    for label, urls in (("Broken", broken), ("Slow", slow), ("Oversized", oversized)):
+        if not urls:
+            continue
+        print(f"\n{label}:")
+        for url in urls:
+            result = results[url]
+            status = result["status"] if result["error"] is None else result["error"]
+            if is_dead(result):
+                status = f"{status} (dead)"
+            elif result.get("failures"):
+                status = f"{status} (failed {result['failures']}/{DEAD_AFTER_FAILURES} runs)"
+            size = f"{result['size'] / 1024:.0f} KB" if result["size"] else "unknown size"
+            print(f"  {status} | {result['latency']:.2f}s | {size} | {result['content_type'] or 'unknown type'}")
+            print(f"    {url}")
+            print(f"    used by: {', '.join(names[url])}")
+
+
+# --- Command ---
+def run(workers=DEFAULT_WORKERS, max_size=OVERSIZED_THRESHOLD, refresh=False, repair=True):
+    """Checks every media URL in content.json and, if `repair` is set, replaces dead images."""
+    with open(CONTENT_FILE, 'r') as f:
+        data = json.load(f)
+
+    entries = list(iter_media_entries(data))
+    urls = list(dict.fromkeys(url for _, _, url in entries))
+    results = check_urls(urls, workers, refresh=refresh)
+    print_report(entries, results, max_size)
+
+    if not repair:
+        return
+    if any(is_dead(results[url]) for _, field, url in entries if field == "image"):
+        print("\nReplacing dead images with fresh covers...")
+        if repair_dead_images(entries, results):
+            save_content(data)
+            print(f"Content saved to {CONTENT_FILE}.")
@@ -0,0 +1 @@
+"""Backend implementations, loaded lazily through animex.backends."""
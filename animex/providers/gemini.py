@@ -0,0 +1,62 @@
+"""Google Gemini AI backend."""
+import re
+
+from animex.config import get_api_key
+
+MODEL_NAME = 'gemini-1.5-flash'
+
+PROMPT_TEMPLATE = """List exactly {count} anime that fit this description: '{description}'.
+
+IMPORTANT: Follow this exact format for your response:
+- Return ONLY the anime titles
+- One title per line
+- No numbers, bullets, dashes, or prefixes
+- No descriptions or explanations
+- No extra text before or after the list
+- Use the most commonly known English or romanized title
+
+Example format:
+Attack on Titan
+Death Note
+Spirited Away
+
+Your response for '{description}':"""
+
+
+def parse_titles(text, count):
+    """Cleans an AI response into a list of at most `count` titles."""
+    titles = []
+    for line in text.strip().split('\n'):
+        # Remove common prefixes like "1.", "- ", "• ", etc.
+        cleaned = re.sub(r'^[\d\.\-\•\*\s]+', '', line.strip()).strip()
+        if cleaned and len(cleaned) > 1:  # Ensure it's not just whitespace or single character
+            titles.append(cleaned)
+    return titles[:count]
+
+
+class GeminiProvider:
+    """
+    AI backend that asks Gemini for anime titles matching a description.
+
+    The google-generativeai SDK is imported when the provider is created,
+    not when this module is imported.
+    """
+
+    def __init__(self, api_key=None):
+        try:
+            import google.generativeai as genai
+        except ImportError as e:
+            raise ImportError(
+                "The 'google-generativeai' library is not installed. "
+                "Please install it by running: pip install google-generativeai"
+            ) from e
+
+        genai.configure(api_key=api_key or get_api_key())
+        self.model = genai.GenerativeModel(MODEL_NAME)
+
+    def suggest_titles(self, description, count=10):
+        """Returns up to `count` anime titles matching `description`."""
+        response = self.model.generate_content(PROMPT_TEMPLATE.format(count=count, description=description))
+        if not response.text:
+            return []
+        return parse_titles(response.text, count)
@@ -0,0 +1,185 @@
+"""Jikan (MyAnimeList) metadata backend."""
+import collections
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+# --- Configuration ---
+JIKAN_API_BASE_URL = "https://api.jikan.moe/v4"
+
+# Jikan rate limiting
+REQUEST_TIMESTAMPS = collections.deque()
+REQUEST_LIMIT = 3  # 3 requests per second
+TIME_WINDOW = 1    # 1 second
+# Guards REQUEST_TIMESTAMPS, since pages may be prefetched from a background thread
+REQUEST_LOCK = threading.Lock()
+JIKAN_PAGE_LIMIT = 25  # Maximum page size accepted by Jikan list endpoints
+
+
+# --- Jikan API Interaction with Rate Limiting ---
+def jikan_api_request(endpoint, params=None):
+    """
+    Makes a rate-limited request to the Jikan API.
+    Waits if the request limit has been reached in the last second.
+    """
+    while True:
+        with REQUEST_LOCK:
+            now = time.time()
+            # Remove timestamps older than the time window
+            while REQUEST_TIMESTAMPS and REQUEST_TIMESTAMPS[0] < now - TIME_WINDOW:
+                REQUEST_TIMESTAMPS.popleft()
+
+            if len(REQUEST_TIMESTAMPS) < REQUEST_LIMIT:
+                REQUEST_TIMESTAMPS.append(now)
+                break
+
+            # Calculate sleep time to respect the rate limit
+            sleep_time = (REQUEST_TIMESTAMPS[0] + TIME_WINDOW) - now + 0.05 # small buffer
+        print(f"Jikan rate limit reached. Waiting for {sleep_time:.2f} seconds...")
+        time.sleep(sleep_time)
+
+    try:
+        print(f"Making Jikan request to: {JIKAN_API_BASE_URL}{endpoint}")
+        response = requests.get(f"{JIKAN_API_BASE_URL}{endpoint}", params=params)
+        response.raise_for_status() # Raises an HTTPError for bad responses (4xx or 5xx)
+        return response.json()
+    except requests.exceptions.RequestException as e:
+        print(f"\n--- Jikan API Error --- \n{e}\n------------------")
+        return None
+
+
+def format_anime_data(anime_obj):
+    """Formats Jikan anime data into the structure needed for content.json."""
+    return {
+        "id": anime_obj['mal_id'],
+        "name": anime_obj.get('title_english') or anime_obj.get('title'),
+        "image": anime_obj['images']['jpg']['large_image_url']
+    }
+
+
+class JikanFetchError(Exception):
+    """Raised when a page of a Jikan list endpoint could not be fetched."""
+
+
+def jikan_paginate(endpoint, params=None, more_needed=None, wanted=None):
+    """
+    Yields items from a paginated Jikan list endpoint, following
+    `pagination.has_next_page` until the endpoint runs out of pages.
+    Raises JikanFetchError if a page fails to load (e.g. rate limited),
+    after yielding everything from the pages before it.
+
+    The next page is fetched in the background while the caller consumes the
+    current one. If `more_needed` is given, it is called with no arguments and
+    should return how many more items the caller still wants; the next page is
+    then only requested once the rest of the current page can no longer cover
+    that number, so pages that will never be read are not fetched. `wanted`
+    is an optional predicate for items that count towards `more_needed`;
+    items it rejects (such as duplicates) are left out of that estimate, so a
+    page full of duplicates starts the prefetch straight away.
+    """
+    params = dict(params or {})
+    page = params.pop('page', 1)
+
+    def fetch(page_number):
+        results = jikan_api_request(endpoint, params={**params, "page": page_number})
+        if results is None:
+            raise JikanFetchError(f"Could not fetch page {page_number} of {endpoint}.")
+        return results
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        results = fetch(page)
+        while results.get('data'):
+            items = results['data']
+            has_next = results.get('pagination', {}).get('has_next_page', False)
+            next_page = None
+            counted = [wanted(item) if wanted else True for item in items]
+            remaining = sum(counted)
+
+            for item, is_counted in zip(items, counted):
+                if more_needed is not None and more_needed() <= 0:
+                    return
+                if has_next and next_page is None and (more_needed is None or more_needed() > remaining):
+                    next_page = executor.submit(fetch, page + 1)
+                yield item
+                remaining -= is_counted
+
+            if next_page is None:
+                if not has_next or (more_needed is not None and more_needed() <= 0):
+                    return
+                next_page = executor.submit(fetch, page + 1)
+            page += 1
+            results = next_page.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def collect_new_anime(endpoint, params, existing_ids, count):
+    """
+    Walks a Jikan list endpoint until `count` anime whose IDs are not in
+    `existing_ids` have been found. Returns (new_items, skipped_count,
+    fetch_failed), where new_items are already formatted for content.json and
+    fetch_failed is True if a page could not be loaded before `count` was
+    reached, rather than the endpoint running out of anime.
+    """
+    seen_ids = set(existing_ids)
+    new_items = []
+    skipped_count = 0
+    params = {"limit": JIKAN_PAGE_LIMIT, **(params or {})}
+
+    pages = jikan_paginate(endpoint, params,
+                           more_needed=lambda: count - len(new_items),
+                           wanted=lambda anime_obj: anime_obj['mal_id'] not in seen_ids)
+    try:
+        for anime_obj in pages:
+            if anime_obj['mal_id'] in seen_ids:
+                skipped_count += 1
+                continue
+            seen_ids.add(anime_obj['mal_id'])
+            new_items.append(format_anime_data(anime_obj))
+    except JikanFetchError as e:
+        print(f"\n--- Jikan API Error --- \n{e}\n------------------")
+        return new_items, skipped_count, True
+
+    return new_items, skipped_count, False
+
+
+class JikanProvider:
+    """
+    Metadata backend backed by the Jikan API.
+
+    Search results are Jikan anime objects (`mal_id`, `title`,
+    `title_english`, `type`, `year`, `images`); other metadata backends are
+    expected to return objects of the same shape.
+    """
+
+    # Categories offered by "Auto-populate", as label -> (endpoint, params)
+    CATEGORIES = {
+        "Top Anime by Popularity": ("/top/anime", {"filter": "bypopularity"}),
+        "Upcoming Season": ("/seasons/upcoming", {}),
+        "Top Airing Anime": ("/top/anime", {"filter": "airing"}),
+    }
+
+    def search(self, query, limit=10):
+        """Returns a list of anime matching `query`, or None if the request failed."""
+        results = jikan_api_request("/anime", params={"q": query, "limit": limit})
+        if not results:
+            return None
+        return results.get('data', [])
+
+    def get_anime(self, anime_id):
+        """Returns a single anime object by ID, or None if it could not be fetched."""
+        results = jikan_api_request(f"/anime/{anime_id}")
+        if not results:
+            return None
+        return results.get('data')
+
+    def collect_new(self, category, existing_ids, count):
+        """Collects up to `count` new anime from one of CATEGORIES. See collect_new_anime."""
+        endpoint, params = self.CATEGORIES[category]
+        return collect_new_anime(endpoint, params, existing_ids, count)
+
+    def format(self, anime_obj):
+        return format_anime_data(anime_obj)
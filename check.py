@@ -0,0 +1,7 @@
+"""Media link-health checker. Kept for existing workflows; equivalent to `animex check`."""
+import sys
+
+from animex.cli import main
+
+if __name__ == "__main__":
+    main(["check", *sys.argv[1:]])
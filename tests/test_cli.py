@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from animex import backends, cli, importtime
+from animex.providers import gogo
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def reset_selection(monkeypatch):
+    monkeypatch.setattr(backends, "_selected", {})
+
+
+def test_unknown_backend_name_fails_before_menu(monkeypatch):
+    monkeypatch.setattr(cli, "manage", lambda: pytest.fail("menu opened"))
+
+    with pytest.raises(SystemExit):
+        cli.main(["--metadata", "nope", "manage"])
+
+
+def test_missing_backend_module_fails_before_menu(monkeypatch):
+    monkeypatch.setattr(cli, "manage", lambda: pytest.fail("menu opened"))
+
+    with pytest.raises(SystemExit):
+        cli.main(["--metadata", "animex.no_such_module:Provider", "manage"])
+
+
+def test_selected_backend_does_not_touch_environment(monkeypatch):
+    monkeypatch.delenv("ANIMEX_METADATA_BACKEND", raising=False)
+    monkeypatch.setattr(cli, "manage", lambda: None)
+
+    cli.main(["--metadata", "jikan", "manage"])
+
+    assert backends.resolve("metadata") == backends.BACKENDS["metadata"]["jikan"]
+    assert "ANIMEX_METADATA_BACKEND" not in os.environ
+
+
+@pytest.mark.parametrize("argv", [
+    ["download", "one-piece-dub", "--start", "1"],
+    ["download", "one-piece-dub", "--end", "5"],
+    ["download", "one-piece-dub", "--episode", "2", "--start", "1", "--end", "5"],
+])
+def test_download_rejects_incomplete_or_conflicting_ranges(monkeypatch, argv):
+    monkeypatch.setattr(cli, "download", lambda args: pytest.fail("download started"))
+
+    with pytest.raises(SystemExit):
+        cli.main(argv)
+
+
+@pytest.mark.parametrize("option", ["--workers", "--max-size"])
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_check_rejects_non_positive_limits(monkeypatch, option, value):
+    monkeypatch.setattr(cli, "check_links", lambda args: pytest.fail("check started"))
+
+    with pytest.raises(SystemExit):
+        cli.main(["check", option, value])
+
+
+@pytest.mark.parametrize("module", ["animex", "animex.cli"])
+def test_import_loads_no_heavy_backend(module):
+    _, eager = importtime.time_import(module)
+
+    assert eager == []
+
+
+def test_importing_wrappers_has_no_side_effects():
+    code = "import importlib; import get, check; importlib.import_module('in')"
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, stdin=subprocess.DEVNULL,
+                            capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == ""
+
+
+def test_import_report_rejects_zero_runs():
+    with pytest.raises(SystemExit):
+        cli.main(["import-report", "--runs", "0"])
+
+
+def test_import_report_fails_cleanly_for_unknown_module(capsys):
+    assert importtime.report(module="animex.no_such_module", runs=1) == 1
+    assert "could not import animex.no_such_module" in capsys.readouterr().out
+
+
+def test_download_rejects_reversed_range(monkeypatch):
+    monkeypatch.setattr(cli, "download", lambda args: pytest.fail("download started"))
+
+    with pytest.raises(SystemExit):
+        cli.main(["download", "one-piece-dub", "--start", "5", "--end", "2"])
+
+
+def test_download_reports_missing_optional_dependencies(monkeypatch, capsys):
+    monkeypatch.setattr(gogo, "OPTIONAL_DEPENDENCIES", ("animex_no_such_dependency",))
+
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(["download", "one-piece-dub", "--episode", "1"])
+
+    assert exit_info.value.code == 1
+    assert "pip install animex[download]" in capsys.readouterr().out
@@ -0,0 +1,79 @@
+import pytest
+
+from animex.providers import jikan
+
+PAGE_SIZE = 25
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """Serves `total_pages` pages of PAGE_SIZE anime and records which pages were requested."""
+    state = {"total_pages": 4, "fail_on": None, "requested": []}
+
+    def fake_request(endpoint, params=None):
+        page = params["page"]
+        state["requested"].append(page)
+        if page == state["fail_on"]:
+            return None
+        data = [{"mal_id": (page - 1) * PAGE_SIZE + i, "title": f"Anime {i}",
+                 "images": {"jpg": {"large_image_url": f"https://example.com/{page}/{i}.jpg"}}}
+                for i in range(PAGE_SIZE)]
+        return {"data": data, "pagination": {"has_next_page": page < state["total_pages"]}}
+
+    monkeypatch.setattr(jikan, "jikan_api_request", fake_request)
+    return state
+
+
+@pytest.mark.parametrize("count, expected_pages", [(3, [1]), (25, [1]), (26, [1, 2])])
+def test_collect_new_fetches_only_needed_pages(pages, count, expected_pages):
+    new_items, skipped_count, fetch_failed = jikan.collect_new_anime("/top/anime", {}, [], count)
+
+    assert len(new_items) == count
+    assert skipped_count == 0
+    assert not fetch_failed
+    assert sorted(pages["requested"]) == expected_pages
+
+
+def test_collect_new_prefetches_past_duplicate_page(pages):
+    existing_ids = range(PAGE_SIZE)  # all of page 1
+
+    new_items, skipped_count, fetch_failed = jikan.collect_new_anime("/top/anime", {}, existing_ids, 5)
+
+    assert [item["id"] for item in new_items] == list(range(PAGE_SIZE, PAGE_SIZE + 5))
+    assert skipped_count == PAGE_SIZE
+    assert not fetch_failed
+    assert sorted(pages["requested"]) == [1, 2]
+
+
+def test_collect_new_exhausts_endpoint_of_duplicates(pages):
+    existing_ids = range(pages["total_pages"] * PAGE_SIZE)
+
+    new_items, skipped_count, fetch_failed = jikan.collect_new_anime("/top/anime", {}, existing_ids, 10)
+
+    assert new_items == []
+    assert skipped_count == pages["total_pages"] * PAGE_SIZE
+    assert not fetch_failed
+    assert sorted(pages["requested"]) == [1, 2, 3, 4]
+
+
+def test_collect_new_reports_failed_page(pages):
+    pages["fail_on"] = 2
+
+    new_items, skipped_count, fetch_failed = jikan.collect_new_anime("/top/anime", {}, [], 40)
+
+    assert len(new_items) == PAGE_SIZE
+    assert fetch_failed
+
+
+def test_paginate_raises_on_failed_page(pages):
+    pages["fail_on"] = 1
+
+    with pytest.raises(jikan.JikanFetchError):
+        list(jikan.jikan_paginate("/top/anime"))
+
+
+def test_paginate_without_limit_follows_every_page(pages):
+    items = list(jikan.jikan_paginate("/top/anime"))
+
+    assert len(items) == pages["total_pages"] * PAGE_SIZE
+    assert pages["requested"] == [1, 2, 3, 4]
@@ -0,0 +1,166 @@
+import os
+import subprocess
+import sys
+
+import pytest
+import requests
+
+from animex import links
+
+
+class FakeResponse:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Answers HEAD with `head_response` (default `response`) and GET with `response`, or raises `error`."""
+
+    def __init__(self, response=None, error=None, head_response=None):
+        self.response = response
+        self.head_response = head_response or response
+        self.error = error
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def _answer(self, method, url, response):
+        self.calls.append((method, url))
+        if self.error is not None:
+            raise self.error
+        return response
+
+    def head(self, url, **kwargs):
+        return self._answer("HEAD", url, self.head_response)
+
+    def get(self, url, **kwargs):
+        return self._answer("GET", url, self.response)
+
+
+def test_parse_size_prefers_content_range_total():
+    headers = {"Content-Range": "bytes 0-0/524288", "Content-Length": "1"}
+    assert links.parse_size(headers) == 524288
+
+
+def test_parse_size_falls_back_to_content_length():
+    assert links.parse_size({"Content-Length": "2048"}) == 2048
+
+
+def test_parse_size_unknown():
+    assert links.parse_size({"Content-Range": "bytes 0-0/*"}) is None
+    assert links.parse_size({}) is None
+
+
+def test_probe_records_ok_result():
+    session = FakeSession(FakeResponse(200, {"Content-Length": "1024", "Content-Type": "image/jpeg"}))
+
+    result = links.probe_url(session, "https://example.com/a.jpg")
+
+    assert result["status"] == 200
+    assert result["size"] == 1024
+    assert result["content_type"] == "image/jpeg"
+    assert not links.is_broken(result)
+    assert not links.is_dead(result)
+    assert [method for method, _ in session.calls] == ["HEAD"]
+
+
+def test_probe_falls_back_to_ranged_get_without_size():
+    session = FakeSession(FakeResponse(206, {"Content-Range": "bytes 0-0/4096"}), head_response=FakeResponse(200))
+
+    result = links.probe_url(session, "https://example.com/a.jpg")
+
+    assert result["size"] == 4096
+    assert [method for method, _ in session.calls] == ["HEAD", "GET"]
+
+
+def test_is_dead_on_404():
+    result = links.probe_url(FakeSession(FakeResponse(404)), "https://example.com/gone.jpg")
+
+    assert links.is_broken(result)
+    assert links.is_dead(result)
+
+
+@pytest.mark.parametrize("error", [
+    requests.exceptions.ConnectTimeout("timed out"),
+    requests.exceptions.ConnectionError("Connection reset by peer"),
+])
+def test_network_error_is_not_dead_on_first_failure(error):
+    result = links.probe_url(FakeSession(error=error), "https://example.com/a.jpg")
+
+    assert links.is_broken(result)
+    assert not links.is_dead(result)
+    assert result["failures"] == 1
+
+
+def test_repeated_network_errors_become_dead():
+    session = FakeSession(error=requests.exceptions.ConnectionError("Connection reset by peer"))
+    result = None
+    for _ in range(links.DEAD_AFTER_FAILURES):
+        result = links.probe_url(session, "https://example.com/a.jpg", result)
+
+    assert links.is_dead(result)
+
+
+def test_success_resets_failures():
+    failed = links.probe_url(FakeSession(error=requests.exceptions.ConnectionError()), "https://example.com/a.jpg")
+    recovered = links.probe_url(FakeSession(FakeResponse(200, {"Content-Length": "1"})), "https://example.com/a.jpg", failed)
+
+    assert recovered["failures"] == 0
+    assert not links.is_dead(recovered)
+
+
+def test_is_fresh_uses_short_ttl_for_broken_results():
+    ok = {"status": 200, "error": None, "checked_at": 0}
+    broken = {"status": None, "error": "ConnectTimeout: timed out", "checked_at": 0}
+    later = links.ERROR_CACHE_TTL + 1
+
+    assert links.is_fresh(ok, later)
+    assert not links.is_fresh(broken, later)
+    assert not links.is_fresh(ok, links.CACHE_TTL + 1)
+
+
+def test_check_urls_reuses_fresh_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(links, "CACHE_FILE", str(tmp_path / "linkcheck.json"))
+    session = FakeSession(FakeResponse(200, {"Content-Length": "1"}))
+    monkeypatch.setattr(links, "make_session", lambda workers: session)
+
+    links.check_urls(["https://example.com/a.jpg"], workers=2)
+    links.check_urls(["https://example.com/a.jpg"], workers=2)
+
+    assert session.calls == [("HEAD", "https://example.com/a.jpg")]
+
+
+def test_check_urls_drops_urls_no_longer_in_content(tmp_path, monkeypatch):
+    cache_file = tmp_path / "linkcheck.json"
+    monkeypatch.setattr(links, "CACHE_FILE", str(cache_file))
+    monkeypatch.setattr(links, "make_session", lambda workers: FakeSession(FakeResponse(200, {"Content-Length": "1"})))
+
+    links.check_urls(["https://example.com/old.jpg", "https://example.com/a.jpg"], workers=2)
+    links.check_urls(["https://example.com/a.jpg"], workers=2)
+
+    assert list(links.load_cache()) == ["https://example.com/a.jpg"]
+
+
+def test_link_checker_does_not_need_ai_sdk(tmp_path):
+    # A stub SDK that would be importable, so the check is meaningful without google-generativeai installed
+    (tmp_path / "google").mkdir()
+    (tmp_path / "google" / "__init__.py").write_text("")
+    (tmp_path / "google" / "generativeai.py").write_text("")
+    code = ("import importlib.util, sys\n"
+            "assert importlib.util.find_spec('google.generativeai') is not None\n"
+            "import check, animex.links\n"
+            "print('google.generativeai' in sys.modules)\n")
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": str(tmp_path)}
+    output = subprocess.run([sys.executable, "-c", code], cwd=repo_root, env=env,
+                            capture_output=True, text=True, check=True).stdout
+
+    assert output.strip() == "False"